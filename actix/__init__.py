@@ -139,6 +139,7 @@ if _TORCH_AVAILABLE:
         AdaptiveArcTanSwishTorch, StabilizedHarmonicTorch, RationalSwishTorch,
         AdaptiveGatedUnitTorch, ExponentialArcTanTorch, OptimQTorch
     )
+    from .activations_torch import set_fast_math, specialize_shapes
     # Dictionary for convenient access by string name in PyTorch
     torch_activations_map = {
         'OptimA': OptimATorch, 'ParametricPolyTanh': ParametricPolyTanhTorch,
@@ -270,6 +271,9 @@ from .utils import plot_activation, plot_derivative
 __all__ = ['get_activation', 'plot_activation', 'plot_derivative']
 __version__ = "0.5.0"
 
+if _TORCH_AVAILABLE:
+    __all__.extend(['set_fast_math', 'specialize_shapes'])
+
 if _TF_AVAILABLE:
     for act_name, act_class in tf_activations_map.items():
         globals()[act_name] = act_class
@@ -1,31 +1,272 @@
 # actix/activations_torch.py
 
+import functools
+import warnings
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
 
+# --- Kernel Fusion Support ---
+
+_COMPILE = hasattr(torch, "compile")
+
+if _COMPILE:
+    try:
+        # Scalar-parameter modules recompile per (shape, dtype) guard set; a
+        # larger cache avoids recompile churn when many layer instances share
+        # one forward (dynamic=True below keeps shape specialization bounded).
+        torch._dynamo.config.cache_size_limit = 128
+    except Exception:
+        pass
+
+_SPECIALIZE_SHAPES = False
+_SPECIALIZE_CACHE_SIZE = 32
+
+def specialize_shapes(enabled: bool = True):
+    """Toggles per-shape specialized compiled kernels for the activations.
+
+    Inference workloads usually run each activation at one fixed tensor
+    shape; a fully specialized graph (``dynamic=False`` with autotuned block
+    sizes) beats the shape-generic one there. When enabled, each forward
+    dispatches on ``(shape, dtype)`` to a small cache of specialized
+    variants, falling back to the generic dynamic graph for unseen shapes
+    once the cache fills. Leave disabled (the default) for training or
+    varying shapes, where specialization would just churn recompiles.
+    """
+    global _SPECIALIZE_SHAPES
+    _SPECIALIZE_SHAPES = enabled
+
+def _fused(fn):
+    """Wraps an elementwise ``forward`` with ``torch.compile``.
+
+    The activation forwards in this file are chains of pointwise ops; eager
+    execution launches one kernel per op and round-trips the tensor through
+    memory each time. Compiling the forward lets the backend emit a single
+    fused kernel (one load, one store), with the 1-element parameters baked
+    in as scalar constants. Under :func:`specialize_shapes` a per-shape
+    specialized variant is compiled and cached for each hot input shape.
+    Falls back to the eager function when ``torch.compile`` is unavailable
+    or compilation fails at first call (e.g. no host compiler on this
+    platform).
+    """
+    if not _COMPILE:
+        return fn
+    compiled = torch.compile(fn, dynamic=True)
+    specialized = {}  # (shape, dtype) -> shape-specialized compiled variant
+    state = {'use_compiled': True}
+    succeeded = set()  # ids of variants that have compiled and run once
+
+    @functools.wraps(fn)
+    def wrapper(self, x):
+        if state['use_compiled']:
+            target = compiled
+            if _SPECIALIZE_SHAPES:
+                key = (tuple(x.shape), x.dtype)
+                target = specialized.get(key)
+                if target is None:
+                    if len(specialized) < _SPECIALIZE_CACHE_SIZE:
+                        target = torch.compile(fn, dynamic=False, mode="max-autotune")
+                        specialized[key] = target
+                    else:
+                        target = compiled
+            try:
+                result = target(self, x)
+            except Exception:
+                # A variant that already ran compiled is raising a genuine
+                # runtime error (bad input, OOM, ...) that eager would hit
+                # too; propagate it. Only a first-call failure means the
+                # compiler itself cannot handle this platform or forward.
+                if id(target) in succeeded:
+                    raise
+                state['use_compiled'] = False
+                warnings.warn(
+                    "torch.compile failed for %s; falling back to eager "
+                    "execution for this activation." % fn.__qualname__,
+                    RuntimeWarning)
+            else:
+                succeeded.add(id(target))
+                return result
+        return fn(self, x)
+    return wrapper
+
+_LOW_PRECISION_DTYPES = (torch.float16, torch.bfloat16)
+
+def _fp32_shim(fn):
+    """Runs half-precision inputs through the fp32 math path.
+
+    The activation tensor stays FP16/BF16 at the module boundary (halved
+    bandwidth under AMP), but the math itself leans on exp/cosh/pow whose
+    fp16 range overflows well inside the useful input range — and the
+    trainable scalars live in fp32. Upcast, compute, cast back: the AMP
+    fp32-accumulator convention, with both casts fusing into the compiled
+    kernel.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, x):
+        if x.dtype in _LOW_PRECISION_DTYPES:
+            return fn(self, x.float()).to(x.dtype)
+        return fn(self, x)
+    return wrapper
+
+class FusedActivation(nn.Module):
+    """Common base class for the activation modules in this file.
+
+    Every subclass defines a ``forward`` that is a pure chain of elementwise
+    ops — the canonical kernel-fusion case — so the base wraps each subclass
+    ``forward`` with :func:`_fused` (plus the half-precision shim) at
+    class-construction time rather than repeating the decorators on all of
+    them.
+    """
+    _fuse = True  # subclasses set False when their forward resists compilation
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'forward' in cls.__dict__:
+            forward = _fp32_shim(cls.__dict__['forward'])
+            cls.forward = _fused(forward) if cls._fuse else forward
+
+class PackedParams:
+    """Mixin that packs a module's scalar parameters into a single vector.
+
+    Storing each scalar as its own ``nn.Parameter(torch.ones(1))`` costs a
+    tensor dereference, a broadcast and a separate autograd leaf per scalar.
+    Modules using this mixin instead keep one packed ``nn.Parameter`` vector
+    ``_p`` (one state_dict entry, one autograd leaf, contiguous on device)
+    and expose the original attribute names as read-only slices of it, which
+    the compiler sees as constant-foldable slices of one tensor.
+    """
+
+    @staticmethod
+    def slot(index: int):
+        """Returns a property reading slot ``index`` of the packed vector."""
+        return property(lambda self: self._p[index])
+
+    def _init_packed(self, *values):
+        self._p = nn.Parameter(torch.tensor([float(v) for v in values]))
+
+# --- Fast-Math Approximations ---
+
+FAST_MATH = False
+
+def set_fast_math(enabled: bool = True):
+    """Globally toggles rational fast-math approximations of tanh/sigmoid.
+
+    When enabled, tanh-heavy modules substitute a clamped Padé approximation
+    that lowers to FMA-only code instead of hitting the exp unit. Accuracy
+    tradeoff: max absolute error is ~2.3e-2 for tanh (worst around
+    |x| ~ 1.5-2) and ~1.2e-2 for the derived sigmoid. Off by default;
+    intended for inference where exact transcendentals are the throughput
+    bottleneck and that error is tolerable.
+    """
+    global FAST_MATH
+    FAST_MATH = enabled
+
+def _fast_tanh(x):
+    """Lambert's rational tanh approximation, clamped to its valid range."""
+    x = torch.clamp(x, -3.0, 3.0)
+    x2 = x * x
+    return x * (27.0 + x2) / (27.0 + 9.0 * x2)
+
+def _tanh(x):
+    return _fast_tanh(x) if FAST_MATH else torch.tanh(x)
+
+def _sigmoid(x):
+    if FAST_MATH:
+        return 0.5 + 0.5 * _fast_tanh(0.5 * x)
+    return torch.sigmoid(x)
+
+_LOG_2 = 0.6931471805599453
+
+def _gauss(x):
+    """exp(-x*x), shared so the Gaussian factor lowers identically everywhere."""
+    return torch.exp(-x * x)
+
+def _gauss_scaled(x, scale):
+    """exp(-scale * x*x) for the parametric Gaussian envelopes."""
+    return torch.exp(-scale * (x * x))
+
+def _swish(x, beta):
+    """Computes x * sigmoid(beta * x) through the fused F.silu kernel.
+
+    silu(beta*x) / beta == x * sigmoid(beta*x) only for beta away from
+    zero, and beta is a trainable scalar free to drift through it. A masked
+    divisor keeps value and gradient finite everywhere; the explicit
+    sigmoid form (correctly approaching 0.5 * x) takes over near zero.
+    """
+    bx = beta * x
+    use_silu = beta.abs() > 1e-7
+    safe_beta = torch.where(use_silu, beta, torch.ones_like(beta))
+    return torch.where(use_silu, F.silu(bx) / safe_beta, x * torch.sigmoid(bx))
+
 # --- Helper Functions for Torch Activations ---
 
-def torch_lambertw_principal(z, iterations=8):
-    """Computes the principal branch of the Lambert W function for PyTorch."""
-    w = torch.where(z < 1.0, z, torch.log(z + 1e-38))
-    w = torch.clamp(w, min=0.0)
-    for _ in range(iterations):
+@torch.jit.script
+def _lambertw_halley(z: torch.Tensor) -> torch.Tensor:
+    """Scripted Halley iteration for the principal Lambert W branch.
+
+    The literal loop bound lets TorchScript unroll the iterations into a
+    single pointwise graph that the fuser can merge into one kernel, instead
+    of re-dispatching ~6 eager kernels per Python iteration. Halley's cubic
+    convergence matches the accuracy of 8 Newton steps in 4 iterations.
+    """
+    # Branchless startup (Corless et al.): log1p(z) - log1p(log1p(z)) is a
+    # monotone initial guess across the whole principal branch for z >= 0,
+    # so no torch.where mask is materialized.
+    l1 = torch.log1p(torch.relu(z))
+    w = l1 - torch.log1p(l1)
+    for _ in range(4):
         ew = torch.exp(w)
-        w_ew_minus_z = w * ew - z
-        denominator = ew * (w + 1.0) + 1e-20
-        delta_w = w_ew_minus_z / denominator
-        w = w - delta_w
-        w = torch.clamp(w, min=0.0)
+        f = w * ew - z
+        w_plus_1 = w + 1.0
+        denominator = ew * w_plus_1 - (w + 2.0) * f / (2.0 * w_plus_1) + 1e-20
+        w = F.relu(w - f / denominator)
     return w
 
-def torch_ellipj_cn(u, m, num_terms=4):
-    """Computes the Jacobi elliptic function cn(u,m) for PyTorch."""
+def torch_lambertw_principal(z, iterations=8):
+    """Computes the principal branch of the Lambert W function for PyTorch.
+
+    ``iterations`` is kept for backwards compatibility; the scripted Halley
+    solver always runs its fixed, unrolled iteration count.
+    """
+    return _lambertw_halley(z)
+
+class _LambertW(torch.autograd.Function):
+    """Lambert W with an analytic backward.
+
+    Letting autograd differentiate through the unrolled Halley loop stores
+    every iteration's intermediates and replays them in backward. The
+    identity dW/dz = W / (z * (1 + W)) turns backward into two muls and a
+    div using only the forward result.
+    """
+
+    @staticmethod
+    def forward(ctx, z):
+        w = _lambertw_halley(z)
+        ctx.save_for_backward(w)
+        return w
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        w, = ctx.saved_tensors
+        # dW/dz = exp(-w) / (1 + w): equivalent to w / (z * (1 + w)) but
+        # finite at z = 0, where the true derivative is W'(0) = 1.
+        return grad_output * torch.exp(-w) / (1.0 + w)
+
+def torch_ellipj_cn(u, m, num_terms=4, clamp=True):
+    """Computes the Jacobi elliptic function cn(u,m) for PyTorch.
+
+    ``clamp`` bounds the truncated series to [-1, 1]. Within the typical
+    operating range (|u| < 1) the series is already in bounds, so callers
+    that apply their own bounded op downstream (e.g. exp(-clamp(cn))) can
+    pass ``clamp=False`` to skip the extra kernel and its memory traffic.
+    """
     u_sq = torch.square(u)
     cn_val = torch.ones_like(u)
-    if num_terms > 1:
-        term1_val = -u_sq / 2.0
-        cn_val = cn_val + term1_val
+    if num_terms <= 1:
+        return cn_val  # truncated series is identically 1, nothing to clamp
+    term1_val = -u_sq / 2.0
+    cn_val = cn_val + term1_val
     if num_terms > 2:
         u_4 = u_sq * u_sq
         term2_val = (u_4 / 24.0) * (1.0 + 4.0 * m)
@@ -34,30 +275,83 @@ def torch_ellipj_cn(u, m, num_terms=4):
         u_6 = u_4 * u_sq
         term3_val = -(u_6 / 720.0) * (1.0 + 44.0 * m + 16.0 * torch.square(m))
         cn_val = cn_val + term3_val
-    cn_val = torch.clamp(cn_val, -1.0, 1.0)
+    if clamp:
+        cn_val = torch.clamp(cn_val, -1.0, 1.0)
     return cn_val
 
+class _EllipticGaussianFn(torch.autograd.Function):
+    """Fused forward/backward for ``x * exp(-cn(x, m))``.
+
+    Computes the truncated Jacobi series, the clamp and the gating
+    ``x * exp(-cn)`` in one pass instead of ~12 ATen dispatches, and
+    differentiates the series analytically in backward rather than replaying
+    the forward graph (clamped regions get zero gradient, matching autograd
+    through ``torch.clamp``). An autograd.Function is opaque to
+    torch.compile, so this replaces the compiled path for
+    EllipticGaussianActivationTorch instead of supplementing it.
+    """
+
+    @staticmethod
+    def forward(ctx, x, m):
+        u_sq = x * x
+        u_4 = u_sq * u_sq
+        u_6 = u_4 * u_sq
+        cn_raw = (1.0 - u_sq / 2.0
+                  + (u_4 / 24.0) * (1.0 + 4.0 * m)
+                  - (u_6 / 720.0) * (1.0 + 44.0 * m + 16.0 * m * m))
+        exp_neg_cn = torch.exp(-torch.clamp(cn_raw, -1.0, 1.0))
+        ctx.save_for_backward(x, m, cn_raw, exp_neg_cn)
+        return x * exp_neg_cn
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        x, m, cn_raw, exp_neg_cn = ctx.saved_tensors
+        u_sq = x * x
+        u_3 = u_sq * x
+        u_4 = u_sq * u_sq
+        u_5 = u_4 * x
+        u_6 = u_4 * u_sq
+        inside = (cn_raw > -1.0) & (cn_raw < 1.0)
+        dcn_dx = torch.where(
+            inside,
+            -x + (u_3 / 6.0) * (1.0 + 4.0 * m)
+            - (u_5 / 120.0) * (1.0 + 44.0 * m + 16.0 * m * m),
+            torch.zeros_like(x))
+        dcn_dm = torch.where(
+            inside,
+            u_4 / 6.0 - (u_6 / 720.0) * (44.0 + 32.0 * m),
+            torch.zeros_like(cn_raw))
+        grad_x = grad_output * exp_neg_cn * (1.0 - x * dcn_dx)
+        grad_m = (grad_output * (-x) * exp_neg_cn * dcn_dm).sum().reshape(m.shape)
+        return grad_x, grad_m
+
 # --- Parametric Activation Functions (PyTorch Modules) ---
 
-class OptimATorch(nn.Module):
+class OptimATorch(PackedParams, FusedActivation):
     """
     OptimA: An 'Optimal Activation' function with trainable parameters for PyTorch.
     f(x) = alpha * tanh(beta * x) + gamma * softplus(delta * x) * sigmoid(lambda_ * x)
     """
+    alpha = PackedParams.slot(0)
+    beta = PackedParams.slot(1)
+    gamma_param = PackedParams.slot(2)
+    delta = PackedParams.slot(3)
+    lambda_param = PackedParams.slot(4)
+
     def __init__(self):
         super(OptimATorch, self).__init__()
-        self.alpha = nn.Parameter(torch.ones(1))
-        self.beta = nn.Parameter(torch.full((1,), 0.5))
-        self.gamma_param = nn.Parameter(torch.ones(1))
-        self.delta = nn.Parameter(torch.full((1,), 0.5))
-        self.lambda_param = nn.Parameter(torch.ones(1))
+        self._init_packed(1.0, 0.5, 1.0, 0.5, 1.0)
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        term1 = self.alpha * torch.tanh(self.beta * x)
-        term2 = self.gamma_param * F.softplus(self.delta * x) * torch.sigmoid(self.lambda_param * x)
-        return term1 + term2
+        # The three scaled copies of x lead the graph so the compiler can
+        # CSE them (they collapse to one multiply whenever two of the
+        # scales converge) and schedule them with the trailing ops.
+        bx = self.beta * x
+        dx = self.delta * x
+        lx = self.lambda_param * x
+        return self.alpha * _tanh(bx) + self.gamma_param * F.softplus(dx) * _sigmoid(lx)
 
-class ParametricPolyTanhTorch(nn.Module):
+class ParametricPolyTanhTorch(FusedActivation):
     """f(x) = alpha * tanh(beta * x^2 + gamma * x + delta)"""
     def __init__(self):
         super(ParametricPolyTanhTorch, self).__init__()
@@ -66,9 +360,9 @@ class ParametricPolyTanhTorch(nn.Module):
         self.gamma = nn.Parameter(torch.zeros(1))
         self.delta_param = nn.Parameter(torch.zeros(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.alpha * torch.tanh(self.beta * torch.square(x) + self.gamma * x + self.delta_param)
+        return self.alpha * _tanh(self.beta * torch.square(x) + self.gamma * x + self.delta_param)
 
-class AdaptiveRationalSoftsignTorch(nn.Module):
+class AdaptiveRationalSoftsignTorch(FusedActivation):
     """f(x) = (alpha * x) / (1 + |beta * x|^gamma)"""
     def __init__(self):
         super(AdaptiveRationalSoftsignTorch, self).__init__()
@@ -78,7 +372,7 @@ class AdaptiveRationalSoftsignTorch(nn.Module):
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         return (self.alpha * x) / (1.0 + torch.pow(torch.abs(self.beta * x), self.gamma_param))
 
-class OptimXTemporalTorch(nn.Module):
+class OptimXTemporalTorch(FusedActivation):
     """f(x) = alpha * tanh(beta * x) + gamma * sigmoid(delta * x)"""
     def __init__(self):
         super(OptimXTemporalTorch, self).__init__()
@@ -87,18 +381,18 @@ class OptimXTemporalTorch(nn.Module):
         self.gamma_param = nn.Parameter(torch.full((1,), 0.5))
         self.delta = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.alpha * torch.tanh(self.beta * x) + self.gamma_param * torch.sigmoid(self.delta * x)
+        return self.alpha * _tanh(self.beta * x) + self.gamma_param * _sigmoid(self.delta * x)
 
-class ParametricGaussianActivationTorch(nn.Module):
+class ParametricGaussianActivationTorch(FusedActivation):
     """f(x) = alpha * x * exp(-beta * x^2)"""
     def __init__(self):
         super(ParametricGaussianActivationTorch, self).__init__()
         self.alpha = nn.Parameter(torch.ones(1))
         self.beta = nn.Parameter(torch.ones(1)) # Beta should be > 0; consider constraints if necessary
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.alpha * x * torch.exp(-self.beta * torch.square(x))
+        return self.alpha * x * _gauss_scaled(x, self.beta)
 
-class LearnableFourierActivationTorch(nn.Module):
+class LearnableFourierActivationTorch(FusedActivation):
     """f(x) = alpha * sin(beta * x + gamma_shift) + delta * cos(lambda_param * x + phi)"""
     def __init__(self):
         super(LearnableFourierActivationTorch, self).__init__()
@@ -113,7 +407,7 @@ class LearnableFourierActivationTorch(nn.Module):
         term2 = self.delta_param * torch.cos(self.lambda_param * x + self.phi)
         return term1 + term2
 
-class A_ELuCTorch(nn.Module):
+class A_ELuCTorch(FusedActivation):
     """f(x) = alpha * ELU(beta * x) + gamma * x * sigmoid(delta * x)"""
     def __init__(self):
         super(A_ELuCTorch, self).__init__()
@@ -123,10 +417,10 @@ class A_ELuCTorch(nn.Module):
         self.delta = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         term1 = self.alpha * F.elu(self.beta * x)
-        term2 = self.gamma_param * x * torch.sigmoid(self.delta * x)
+        term2 = self.gamma_param * _swish(x, self.delta)
         return term1 + term2
 
-class ParametricSmoothStepTorch(nn.Module):
+class ParametricSmoothStepTorch(FusedActivation):
     """f(x) = alpha * sigmoid(beta_slope*(x - gamma_shift)) - alpha * sigmoid(delta_slope_param*(x + mu_shift))"""
     def __init__(self):
         super(ParametricSmoothStepTorch, self).__init__()
@@ -136,11 +430,13 @@ class ParametricSmoothStepTorch(nn.Module):
         self.delta_slope_param = nn.Parameter(torch.ones(1))
         self.mu_shift = nn.Parameter(torch.zeros(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        term1 = self.alpha * torch.sigmoid(self.beta_slope * (x - self.gamma_shift))
-        term2 = self.alpha * torch.sigmoid(self.delta_slope_param * (x + self.mu_shift))
-        return term1 - term2
+        # sigmoid(a) - sigmoid(b) == 0.5 * (tanh(a/2) - tanh(b/2)): one tanh
+        # per term is cheaper than the two-exp sigmoid difference.
+        term1 = torch.tanh(0.5 * self.beta_slope * (x - self.gamma_shift))
+        term2 = torch.tanh(0.5 * self.delta_slope_param * (x + self.mu_shift))
+        return 0.5 * self.alpha * (term1 - term2)
 
-class AdaptiveBiHyperbolicTorch(nn.Module):
+class AdaptiveBiHyperbolicTorch(FusedActivation):
     """f(x) = alpha * tanh(beta * x) + (1-alpha) * tanh^3(gamma_param * x)"""
     def __init__(self):
         super(AdaptiveBiHyperbolicTorch, self).__init__()
@@ -148,20 +444,21 @@ class AdaptiveBiHyperbolicTorch(nn.Module):
         self.beta = nn.Parameter(torch.ones(1))
         self.gamma_param = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        term1 = self.alpha * torch.tanh(self.beta * x)
-        term2 = (1.0 - self.alpha) * torch.pow(torch.tanh(self.gamma_param * x), 3)
+        tanh_gx = _tanh(self.gamma_param * x)
+        term1 = self.alpha * _tanh(self.beta * x)
+        term2 = (1.0 - self.alpha) * (tanh_gx * tanh_gx * tanh_gx)
         return term1 + term2
 
-class ParametricLogishTorch(nn.Module):
+class ParametricLogishTorch(FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * x)"""
     def __init__(self):
         super(ParametricLogishTorch, self).__init__()
         self.alpha = nn.Parameter(torch.ones(1))
         self.beta = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.alpha * x * torch.sigmoid(self.beta * x)
+        return self.alpha * _swish(x, self.beta)
 
-class AdaptSigmoidReLUTorch(nn.Module):
+class AdaptSigmoidReLUTorch(FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * x) + gamma_param * ReLU(delta * x)"""
     def __init__(self):
         super(AdaptSigmoidReLUTorch, self).__init__()
@@ -170,11 +467,11 @@ class AdaptSigmoidReLUTorch(nn.Module):
         self.gamma_param = nn.Parameter(torch.full((1,), 0.5))
         self.delta = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        term1 = self.alpha * x * torch.sigmoid(self.beta * x)
+        term1 = self.alpha * _swish(x, self.beta)
         term2 = self.gamma_param * F.relu(self.delta * x)
         return term1 + term2
 
-class ParametricLambertWActivationTorch(nn.Module):
+class ParametricLambertWActivationTorch(FusedActivation):
     """f(x) = alpha * x * W(|beta| * exp(gamma * x)) where W is the Lambert W function."""
     def __init__(self):
         super(ParametricLambertWActivationTorch, self).__init__()
@@ -183,10 +480,10 @@ class ParametricLambertWActivationTorch(nn.Module):
         self.gamma = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         arg_lambertw = torch.abs(self.beta) * torch.exp(self.gamma * x)
-        lambertw_val = torch_lambertw_principal(arg_lambertw)
+        lambertw_val = _LambertW.apply(arg_lambertw)
         return self.alpha * x * lambertw_val
 
-class AdaptiveHyperbolicLogarithmTorch(nn.Module):
+class AdaptiveHyperbolicLogarithmTorch(FusedActivation):
     """f(x) = alpha * asinh(beta * x) + gamma * log(|delta| + x^2)"""
     def __init__(self):
         super(AdaptiveHyperbolicLogarithmTorch, self).__init__()
@@ -195,11 +492,14 @@ class AdaptiveHyperbolicLogarithmTorch(nn.Module):
         self.gamma = nn.Parameter(torch.ones(1))
         self.delta = nn.Parameter(torch.full((1,), 0.5))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        abs_delta = torch.abs(self.delta) + 1e-7
         term1 = self.alpha * torch.asinh(self.beta * x)
-        term2 = self.gamma * torch.log(torch.abs(self.delta) + torch.square(x) + 1e-7)
+        # log(|d| + x^2) == log1p(x^2/|d|) + log|d| keeps precision when
+        # |d| is small relative to x^2.
+        term2 = self.gamma * (torch.log1p(torch.square(x) / abs_delta) + torch.log(abs_delta))
         return term1 + term2
 
-class ParametricGeneralizedGompertzActivationTorch(nn.Module):
+class ParametricGeneralizedGompertzActivationTorch(FusedActivation):
     """f(x) = alpha * exp(-beta * exp(-gamma * x)) - delta"""
     def __init__(self):
         super(ParametricGeneralizedGompertzActivationTorch, self).__init__()
@@ -210,37 +510,43 @@ class ParametricGeneralizedGompertzActivationTorch(nn.Module):
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         return self.alpha * torch.exp(-self.beta * torch.exp(-self.gamma * x)) - self.delta
 
-class ComplexHarmonicActivationTorch(nn.Module):
+class ComplexHarmonicActivationTorch(PackedParams, FusedActivation):
     """f(x) = alpha * tanh(beta * x) + gamma * sin(delta * x^2 + lambda)"""
+    alpha = PackedParams.slot(0)
+    beta = PackedParams.slot(1)
+    gamma = PackedParams.slot(2)
+    delta = PackedParams.slot(3)
+    lambda_param = PackedParams.slot(4)
+
     def __init__(self):
         super(ComplexHarmonicActivationTorch, self).__init__()
-        self.alpha = nn.Parameter(torch.ones(1))
-        self.beta = nn.Parameter(torch.ones(1))
-        self.gamma = nn.Parameter(torch.ones(1))
-        self.delta = nn.Parameter(torch.ones(1))
-        self.lambda_param = nn.Parameter(torch.zeros(1))
+        self._init_packed(1.0, 1.0, 1.0, 1.0, 0.0)
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        term1 = self.alpha * torch.tanh(self.beta * x)
+        term1 = self.alpha * _tanh(self.beta * x)
         term2 = self.gamma * torch.sin(self.delta * torch.square(x) + self.lambda_param)
         return term1 + term2
 
-class WeibullSoftplusActivationTorch(nn.Module):
+class WeibullSoftplusActivationTorch(PackedParams, FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * (x - gamma)) + delta * (1 - exp(-|lambda| * |x|^|mu|))"""
+    alpha = PackedParams.slot(0)
+    beta = PackedParams.slot(1)
+    gamma = PackedParams.slot(2)
+    delta = PackedParams.slot(3)
+    lambda_param = PackedParams.slot(4)
+    mu = PackedParams.slot(5)
+
     def __init__(self):
         super(WeibullSoftplusActivationTorch, self).__init__()
-        self.alpha = nn.Parameter(torch.ones(1))
-        self.beta = nn.Parameter(torch.ones(1))
-        self.gamma = nn.Parameter(torch.zeros(1))
-        self.delta = nn.Parameter(torch.ones(1))
-        self.lambda_param = nn.Parameter(torch.ones(1))
-        self.mu = nn.Parameter(torch.ones(1))
+        self._init_packed(1.0, 1.0, 0.0, 1.0, 1.0, 1.0)
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        abs_lambda = self.lambda_param.abs()
+        abs_mu = self.mu.abs()
         term1 = self.alpha * x * torch.sigmoid(self.beta * (x - self.gamma))
-        weibull_exponent = torch.abs(self.lambda_param) * torch.pow(torch.abs(x) + 1e-7, torch.abs(self.mu))
-        term2 = self.delta * (1.0 - torch.exp(-weibull_exponent))
+        weibull_exponent = abs_lambda * torch.pow(torch.abs(x) + 1e-7, abs_mu)
+        term2 = self.delta * (-torch.expm1(-weibull_exponent))
         return term1 + term2
 
-class AdaptiveErfSwishTorch(nn.Module):
+class AdaptiveErfSwishTorch(FusedActivation):
     """f(x) = alpha * x * erf(beta * x) * sigmoid(gamma * x)"""
     def __init__(self):
         super(AdaptiveErfSwishTorch, self).__init__()
@@ -250,7 +556,7 @@ class AdaptiveErfSwishTorch(nn.Module):
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         return self.alpha * x * torch.erf(self.beta * x) * torch.sigmoid(self.gamma * x)
 
-class ParametricBetaSoftsignTorch(nn.Module):
+class ParametricBetaSoftsignTorch(FusedActivation):
     """f(x) = alpha * sign(x) * (|x|^|beta|) / (1 + |x|^|gamma|)"""
     def __init__(self):
         super(ParametricBetaSoftsignTorch, self).__init__()
@@ -258,12 +564,16 @@ class ParametricBetaSoftsignTorch(nn.Module):
         self.beta = nn.Parameter(torch.ones(1))
         self.gamma = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        abs_x = torch.abs(x)
-        pow_beta = torch.pow(abs_x, torch.abs(self.beta))
-        pow_gamma = torch.pow(abs_x, torch.abs(self.gamma))
-        return self.alpha * (pow_beta / (1.0 + pow_gamma + 1e-7)) * torch.sign(x)
+        # sign(x) * |x|^b == x * |x|^(b-1): folds the sign kernel into the
+        # linear factor and gives a usable subgradient at 0.
+        abs_beta = self.beta.abs()
+        abs_gamma = self.gamma.abs()
+        abs_x = torch.abs(x) + 1e-7
+        pow_beta_m1 = torch.pow(abs_x, abs_beta - 1.0)
+        pow_gamma = torch.pow(abs_x, abs_gamma)
+        return self.alpha * x * pow_beta_m1 / (1.0 + pow_gamma + 1e-7)
 
-class ParametricArcSinhGateTorch(nn.Module):
+class ParametricArcSinhGateTorch(FusedActivation):
     """f(x) = alpha * x * asinh(beta * x)"""
     def __init__(self):
         super(ParametricArcSinhGateTorch, self).__init__()
@@ -272,7 +582,7 @@ class ParametricArcSinhGateTorch(nn.Module):
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         return self.alpha * x * torch.asinh(self.beta * x)
 
-class GeneralizedAlphaSigmoidTorch(nn.Module):
+class GeneralizedAlphaSigmoidTorch(FusedActivation):
     """f(x) = (alpha * x) / (1 + |beta * x|^|gamma|)^(1/|delta|)"""
     def __init__(self):
         super(GeneralizedAlphaSigmoidTorch, self).__init__()
@@ -281,24 +591,27 @@ class GeneralizedAlphaSigmoidTorch(nn.Module):
         self.gamma = nn.Parameter(torch.ones(1))
         self.delta = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        # (1 + |bx|^g)^(1/d) in log space: softplus(g*log|bx|) == log(1+|bx|^g),
+        # so the two pow kernels collapse to one log, one softplus, one exp.
+        abs_gamma = self.gamma.abs()
+        abs_delta = self.delta.abs()
         abs_beta_x = torch.abs(self.beta * x)
-        pow_gamma = torch.pow(abs_beta_x, torch.abs(self.gamma))
-        denominator_base = 1.0 + pow_gamma
-        inv_delta = 1.0 / (torch.abs(self.delta) + 1e-7)
-        denominator = torch.pow(denominator_base, inv_delta)
+        log_denominator_base = F.softplus(abs_gamma * torch.log(abs_beta_x + 1e-7))
+        inv_delta = 1.0 / (abs_delta + 1e-7)
+        denominator = torch.exp(log_denominator_base * inv_delta)
         return (self.alpha * x) / (denominator + 1e-7)
 
-class EllipticGaussianActivationTorch(nn.Module):
+class EllipticGaussianActivationTorch(FusedActivation):
     """f(x) = x * exp(-cn(x, m)) where cn is the Jacobi elliptic function."""
+    _fuse = False  # _EllipticGaussianFn already runs as one fused pass
     def __init__(self):
         super(EllipticGaussianActivationTorch, self).__init__()
         self.m_param = nn.Parameter(torch.full((1,), 0.5))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         m_clamped = torch.clamp(self.m_param, 0.0, 1.0)
-        cn_val = torch_ellipj_cn(x, m_clamped)
-        return x * torch.exp(-cn_val)
+        return _EllipticGaussianFn.apply(x, m_clamped)
 
-class ParametricTanhSwishTorch(nn.Module):
+class ParametricTanhSwishTorch(FusedActivation):
     """f(x) = alpha * x * tanh(beta * x) * sigmoid(gamma * x)"""
     def __init__(self):
         super(ParametricTanhSwishTorch, self).__init__()
@@ -308,7 +621,7 @@ class ParametricTanhSwishTorch(nn.Module):
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         return self.alpha * x * torch.tanh(self.beta * x) * torch.sigmoid(self.gamma * x)
 
-class GeneralizedHarmonicSwishTorch(nn.Module):
+class GeneralizedHarmonicSwishTorch(FusedActivation):
     """f(x) = alpha * x * sin(beta * x^2 + gamma) * sigmoid(delta * x)"""
     def __init__(self):
         super(GeneralizedHarmonicSwishTorch, self).__init__()
@@ -321,7 +634,7 @@ class GeneralizedHarmonicSwishTorch(nn.Module):
         swish_gate = x * torch.sigmoid(self.delta * x)
         return self.alpha * swish_gate * harmonic_part
 
-class A_STReLUTorch(nn.Module):
+class A_STReLUTorch(FusedActivation):
     """f(x) = alpha * ReLU(x) + beta * x * sigmoid(gamma * x) + delta * tanh(lambda * x)"""
     def __init__(self):
         super(A_STReLUTorch, self).__init__()
@@ -336,7 +649,7 @@ class A_STReLUTorch(nn.Module):
         tanh_part = self.delta * torch.tanh(self.lambda_param * x)
         return relu_part + swish_part + tanh_part
 
-class ETUTorch(nn.Module):
+class ETUTorch(FusedActivation):
     """ExponentialTanhUnit: f(x) = alpha * tanh(beta * x) * exp(-gamma * x^2)"""
     def __init__(self):
         super(ETUTorch, self).__init__()
@@ -344,9 +657,9 @@ class ETUTorch(nn.Module):
         self.beta = nn.Parameter(torch.ones(1))
         self.gamma = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.alpha * torch.tanh(self.beta * x) * torch.exp(-self.gamma * torch.square(x))
+        return self.alpha * torch.tanh(self.beta * x) * _gauss_scaled(x, self.gamma)
 
-class PMGLUTorch(nn.Module):
+class PMGLUTorch(FusedActivation):
     """Parametric Multi-Gated Linear Unit: f(x) = (alpha * x + beta) * sigmoid(gamma * x + delta) * tanh(lambda * x)"""
     def __init__(self):
         super(PMGLUTorch, self).__init__()
@@ -361,7 +674,7 @@ class PMGLUTorch(nn.Module):
         tanh_gate = torch.tanh(self.lambda_param * x)
         return linear_part * sigmoid_gate * tanh_gate
 
-class GPOSoftTorch(nn.Module):
+class GPOSoftTorch(FusedActivation):
     """Generalized Parametric Oscillatory Softplus: f(x) = alpha * softplus(beta * x) + gamma * sin(delta * x + lambda)"""
     def __init__(self):
         super(GPOSoftTorch, self).__init__()
@@ -375,7 +688,7 @@ class GPOSoftTorch(nn.Module):
         oscillatory_part = self.gamma * torch.sin(self.delta * x + self.lambda_param)
         return softplus_part + oscillatory_part
 
-class SHLUTorch(nn.Module):
+class SHLUTorch(FusedActivation):
     """Sigmoid-Harmonic Linear Unit: f(x)= (alpha * x) * sigmoid(beta * x) + gamma * cos(delta * x^2 + lambda)"""
     def __init__(self):
         super(SHLUTorch, self).__init__()
@@ -389,7 +702,7 @@ class SHLUTorch(nn.Module):
         harmonic_part = self.gamma * torch.cos(self.delta * torch.square(x) + self.lambda_param)
         return swish_part + harmonic_part
 
-class GaussSwishTorch(nn.Module):
+class GaussSwishTorch(FusedActivation):
     """Gaussian Parametric Swish: f(x) = (alpha * x) * sigmoid(beta * x) * exp(-gamma * x^2)"""
     def __init__(self):
         super(GaussSwishTorch, self).__init__()
@@ -398,10 +711,10 @@ class GaussSwishTorch(nn.Module):
         self.gamma = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         swish_part = self.alpha * x * torch.sigmoid(self.beta * x)
-        gaussian_part = torch.exp(-self.gamma * torch.square(x))
+        gaussian_part = _gauss_scaled(x, self.gamma)
         return swish_part * gaussian_part
 
-class ATanSigUTorch(nn.Module):
+class ATanSigUTorch(FusedActivation):
     """Adaptive ArcTanSigmoid Unit: f(x) = alpha * arctan(beta * x) + gamma * x * sigmoid(delta * x)"""
     def __init__(self):
         super(ATanSigUTorch, self).__init__()
@@ -414,7 +727,7 @@ class ATanSigUTorch(nn.Module):
         swish_part = self.gamma * x * torch.sigmoid(self.delta * x)
         return arctan_part + swish_part
 
-class PAPGTorch(nn.Module):
+class PAPGTorch(FusedActivation):
     """Parametric Adaptive Polynomial Gate: f(x) = (alpha * x + beta * x^3) / (1 + |gamma * x|^delta) + lambda * x * sigmoid(mu * x)"""
     def __init__(self):
         super(PAPGTorch, self).__init__()
@@ -425,13 +738,13 @@ class PAPGTorch(nn.Module):
         self.lambda_param = nn.Parameter(torch.ones(1))
         self.mu = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        numerator = self.alpha * x + self.beta * torch.pow(x, 3)
+        numerator = self.alpha * x + self.beta * (x * x * x)
         denominator = 1.0 + torch.pow(torch.abs(self.gamma * x), self.delta)
         poly_gate_part = numerator / (denominator + 1e-7)
         swish_part = self.lambda_param * x * torch.sigmoid(self.mu * x)
         return poly_gate_part + swish_part
 
-class SwishLogTanhTorch(nn.Module):
+class SwishLogTanhTorch(FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * x) + gamma * tanh(softplus(delta * x))"""
     def __init__(self):
         super(SwishLogTanhTorch, self).__init__()
@@ -444,7 +757,7 @@ class SwishLogTanhTorch(nn.Module):
         log_tanh_part = self.gamma * torch.tanh(F.softplus(self.delta * x))
         return swish_part + log_tanh_part
 
-class ArcGaLUTorch(nn.Module):
+class ArcGaLUTorch(FusedActivation):
     """f(x) = alpha * arctan(beta * x) + gamma * x * sigmoid(delta * x + lambda)"""
     def __init__(self):
         super(ArcGaLUTorch, self).__init__()
@@ -458,7 +771,7 @@ class ArcGaLUTorch(nn.Module):
         gated_linear_part = self.gamma * x * torch.sigmoid(self.delta * x + self.lambda_param)
         return arctan_part + gated_linear_part
 
-class ParametricHyperbolicQuadraticActivationTorch(nn.Module):
+class ParametricHyperbolicQuadraticActivationTorch(FusedActivation):
     """f(x) = alpha * tanh(beta * x^2 + gamma * x) + delta * x * sigmoid(lambda * x)"""
     def __init__(self):
         super(ParametricHyperbolicQuadraticActivationTorch, self).__init__()
@@ -472,7 +785,7 @@ class ParametricHyperbolicQuadraticActivationTorch(nn.Module):
         swish_part = self.delta * x * torch.sigmoid(self.lambda_param * x)
         return tanh_part + swish_part
 
-class RootSoftplusTorch(nn.Module):
+class RootSoftplusTorch(FusedActivation):
     """f(x) = alpha * x + beta * sqrt(softplus(gamma * x))"""
     def __init__(self):
         super(RootSoftplusTorch, self).__init__()
@@ -484,7 +797,7 @@ class RootSoftplusTorch(nn.Module):
         root_softplus_part = self.beta * torch.sqrt(F.softplus(self.gamma * x) + 1e-7)
         return linear_part + root_softplus_part
 
-class AdaptiveSinusoidalSoftgateTorch(nn.Module):
+class AdaptiveSinusoidalSoftgateTorch(FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * x) + gamma * sin(delta * x)"""
     def __init__(self):
         super(AdaptiveSinusoidalSoftgateTorch, self).__init__()
@@ -497,7 +810,7 @@ class AdaptiveSinusoidalSoftgateTorch(nn.Module):
         sin_part = self.gamma * torch.sin(self.delta * x)
         return swish_part + sin_part
 
-class ExpTanhGatedActivationTorch(nn.Module):
+class ExpTanhGatedActivationTorch(FusedActivation):
     """f(x) = alpha * tanh(beta * x) * sigmoid(gamma * exp(delta * x))"""
     def __init__(self):
         super(ExpTanhGatedActivationTorch, self).__init__()
@@ -510,7 +823,7 @@ class ExpTanhGatedActivationTorch(nn.Module):
         exp_gate = torch.sigmoid(self.gamma * torch.exp(self.delta * x))
         return tanh_part * exp_gate
 
-class HybridSinExpUnitTorch(nn.Module):
+class HybridSinExpUnitTorch(FusedActivation):
     """f(x) = alpha * sin(beta * x) + gamma * x * exp(-delta * x^2)"""
     def __init__(self):
         super(HybridSinExpUnitTorch, self).__init__()
@@ -520,10 +833,10 @@ class HybridSinExpUnitTorch(nn.Module):
         self.delta = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         sin_part = self.alpha * torch.sin(self.beta * x)
-        exp_part = self.gamma * x * torch.exp(-self.delta * torch.square(x))
+        exp_part = self.gamma * x * _gauss_scaled(x, self.delta)
         return sin_part + exp_part
 
-class ParametricLogarithmicSwishTorch(nn.Module):
+class ParametricLogarithmicSwishTorch(FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * x) + gamma * log(1 + |delta| * |x|)"""
     def __init__(self):
         super(ParametricLogarithmicSwishTorch, self).__init__()
@@ -533,10 +846,10 @@ class ParametricLogarithmicSwishTorch(nn.Module):
         self.delta = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         swish_part = self.alpha * x * torch.sigmoid(self.beta * x)
-        log_part = self.gamma * torch.log(1.0 + torch.abs(self.delta) * torch.abs(x) + 1e-7)
+        log_part = self.gamma * torch.log1p(torch.abs(self.delta) * torch.abs(x))
         return swish_part + log_part
 
-class AdaptiveCubicSigmoidTorch(nn.Module):
+class AdaptiveCubicSigmoidTorch(FusedActivation):
     """f(x) = alpha * x + beta * x^3 * sigmoid(gamma * x)"""
     def __init__(self):
         super(AdaptiveCubicSigmoidTorch, self).__init__()
@@ -545,10 +858,10 @@ class AdaptiveCubicSigmoidTorch(nn.Module):
         self.gamma = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         linear_part = self.alpha * x
-        cubic_part = self.beta * torch.pow(x, 3) * torch.sigmoid(self.gamma * x)
+        cubic_part = self.beta * (x * x * x) * torch.sigmoid(self.gamma * x)
         return linear_part + cubic_part
 
-class SmoothedAbsoluteGatedUnitTorch(nn.Module):
+class SmoothedAbsoluteGatedUnitTorch(FusedActivation):
     """f(x) = alpha * |x| * sigmoid(beta * x) + gamma * x"""
     def __init__(self):
         super(SmoothedAbsoluteGatedUnitTorch, self).__init__()
@@ -560,7 +873,7 @@ class SmoothedAbsoluteGatedUnitTorch(nn.Module):
         linear_part = self.gamma * x
         return gated_abs_part + linear_part
 
-class GaussianTanhHarmonicUnitTorch(nn.Module):
+class GaussianTanhHarmonicUnitTorch(FusedActivation):
     """f(x) = alpha * tanh(beta * x) + gamma * exp(-delta * (x - lambda)^2)"""
     def __init__(self):
         super(GaussianTanhHarmonicUnitTorch, self).__init__()
@@ -571,10 +884,10 @@ class GaussianTanhHarmonicUnitTorch(nn.Module):
         self.lambda_param = nn.Parameter(torch.zeros(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         tanh_part = self.alpha * torch.tanh(self.beta * x)
-        gaussian_part = self.gamma * torch.exp(-self.delta * torch.square(x - self.lambda_param))
+        gaussian_part = self.gamma * _gauss_scaled(x - self.lambda_param, self.delta)
         return tanh_part + gaussian_part
 
-class SymmetricParametricRationalSigmoidTorch(nn.Module):
+class SymmetricParametricRationalSigmoidTorch(FusedActivation):
     """f(x) = (alpha * x) / (1 + |beta * x^2|^gamma)"""
     def __init__(self):
         super(SymmetricParametricRationalSigmoidTorch, self).__init__()
@@ -585,7 +898,7 @@ class SymmetricParametricRationalSigmoidTorch(nn.Module):
         denominator = 1.0 + torch.pow(torch.abs(self.beta * torch.square(x)), self.gamma)
         return (self.alpha * x) / (denominator + 1e-7)
 
-class AdaptivePolynomialSwishTorch(nn.Module):
+class AdaptivePolynomialSwishTorch(FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * x) + gamma * x^2 * sigmoid(delta * x)"""
     def __init__(self):
         super(AdaptivePolynomialSwishTorch, self).__init__()
@@ -598,7 +911,7 @@ class AdaptivePolynomialSwishTorch(nn.Module):
         poly_swish_part = self.gamma * torch.square(x) * torch.sigmoid(self.delta * x)
         return swish_part + poly_swish_part
 
-class LogSigmoidGatedEluTorch(nn.Module):
+class LogSigmoidGatedEluTorch(FusedActivation):
     """f(x) = alpha * ELU(beta * x) * softplus(gamma * x) * sigmoid(delta * x)"""
     def __init__(self):
         super(LogSigmoidGatedEluTorch, self).__init__()
@@ -612,7 +925,7 @@ class LogSigmoidGatedEluTorch(nn.Module):
         sig_gate = torch.sigmoid(self.delta * x)
         return self.alpha * elu_part * log_gate * sig_gate
 
-class AdaptiveBipolarExponentialUnitTorch(nn.Module):
+class AdaptiveBipolarExponentialUnitTorch(FusedActivation):
     """f(x) = alpha * x + beta * x * exp(-gamma * x^2)"""
     def __init__(self):
         super(AdaptiveBipolarExponentialUnitTorch, self).__init__()
@@ -621,10 +934,10 @@ class AdaptiveBipolarExponentialUnitTorch(nn.Module):
         self.gamma = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         linear_part = self.alpha * x
-        exp_part = self.beta * x * torch.exp(-self.gamma * torch.square(x))
+        exp_part = self.beta * x * _gauss_scaled(x, self.gamma)
         return linear_part + exp_part
 
-class ParametricHyperGaussianGateTorch(nn.Module):
+class ParametricHyperGaussianGateTorch(FusedActivation):
     """f(x) = alpha * x * exp(-beta * |x|^gamma)"""
     def __init__(self):
         super(ParametricHyperGaussianGateTorch, self).__init__()
@@ -635,7 +948,7 @@ class ParametricHyperGaussianGateTorch(nn.Module):
         gate = torch.exp(-torch.abs(self.beta) * torch.pow(torch.abs(x), torch.abs(self.gamma)))
         return self.alpha * x * gate
 
-class TanhGatedArcsinhLinearUnitTorch(nn.Module):
+class TanhGatedArcsinhLinearUnitTorch(FusedActivation):
     """f(x) = alpha * x * tanh(beta * asinh(gamma * x))"""
     def __init__(self):
         super(TanhGatedArcsinhLinearUnitTorch, self).__init__()
@@ -646,7 +959,7 @@ class TanhGatedArcsinhLinearUnitTorch(nn.Module):
         gate = torch.tanh(self.beta * torch.asinh(self.gamma * x))
         return self.alpha * x * gate
 
-class ParametricOddPowerSwishTorch(nn.Module):
+class ParametricOddPowerSwishTorch(FusedActivation):
     """f(x) = alpha * x * sigmoid(beta * x) + gamma * x^3"""
     def __init__(self):
         super(ParametricOddPowerSwishTorch, self).__init__()
@@ -655,10 +968,10 @@ class ParametricOddPowerSwishTorch(nn.Module):
         self.gamma = nn.Parameter(torch.ones(1))
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         swish_part = self.alpha * x * torch.sigmoid(self.beta * x)
-        power_part = self.gamma * torch.pow(x, 3)
+        power_part = self.gamma * (x * x * x)
         return swish_part + power_part
 
-class AdaptiveLinearLogTanhTorch(nn.Module):
+class AdaptiveLinearLogTanhTorch(FusedActivation):
     """f(x) = alpha * x + beta * tanh(gamma * softplus(delta * x))"""
     def __init__(self):
         super(AdaptiveLinearLogTanhTorch, self).__init__()
@@ -671,7 +984,7 @@ class AdaptiveLinearLogTanhTorch(nn.Module):
         log_tanh_part = self.beta * torch.tanh(self.gamma * F.softplus(self.delta * x))
         return linear_part + log_tanh_part
 
-class AdaptiveArcTanSwishTorch(nn.Module):
+class AdaptiveArcTanSwishTorch(FusedActivation):
     """f(x) = α·arctan(β·x) + γ·x·sigmoid(δ·x) + ε·tanh(ζ·x)"""
     def __init__(self):
         super(AdaptiveArcTanSwishTorch, self).__init__()
@@ -687,7 +1000,7 @@ class AdaptiveArcTanSwishTorch(nn.Module):
         tanh_part = self.epsilon * torch.tanh(self.zeta * x)
         return arctan_part + swish_part + tanh_part
 
-class StabilizedHarmonicTorch(nn.Module):
+class StabilizedHarmonicTorch(FusedActivation):
     """f(x) = α·tanh(β·x) + γ·sin(δ·tanh(ε·x)) + ζ·x·sigmoid(η·x)"""
     def __init__(self):
         super(StabilizedHarmonicTorch, self).__init__()
@@ -704,7 +1017,7 @@ class StabilizedHarmonicTorch(nn.Module):
         swish_part = self.zeta * x * torch.sigmoid(self.eta * x)
         return tanh_part + sin_part + swish_part
 
-class RationalSwishTorch(nn.Module):
+class RationalSwishTorch(FusedActivation):
     """f(x) = (α·x·sigmoid(β·x)) / (1 + |γ·x|^δ) + ε·arctan(ζ·x)"""
     def __init__(self):
         super(RationalSwishTorch, self).__init__()
@@ -721,7 +1034,7 @@ class RationalSwishTorch(nn.Module):
         arctan_part = self.epsilon * torch.atan(self.zeta * x)
         return rational_part + arctan_part
 
-class AdaptiveGatedUnitTorch(nn.Module):
+class AdaptiveGatedUnitTorch(FusedActivation):
     """f(x) = α·x·sigmoid(β·x) + γ·x·tanh(δ·x) + ε·arctan(ζ·x)"""
     def __init__(self):
         super(AdaptiveGatedUnitTorch, self).__init__()
@@ -737,7 +1050,7 @@ class AdaptiveGatedUnitTorch(nn.Module):
         arctan_part = self.epsilon * torch.atan(self.zeta * x)
         return sigmoid_gate + tanh_gate + arctan_part
 
-class ExponentialArcTanTorch(nn.Module):
+class ExponentialArcTanTorch(FusedActivation):
     """f(x) = α·arctan(β·x) + γ·x·exp(-δ·|x|) + ε·sigmoid(ζ·x)"""
     def __init__(self):
         super(ExponentialArcTanTorch, self).__init__()
@@ -753,7 +1066,7 @@ class ExponentialArcTanTorch(nn.Module):
         sigmoid_part = self.epsilon * torch.sigmoid(self.zeta * x)
         return arctan_part + exp_decay + sigmoid_part
 
-class OptimQTorch(nn.Module):
+class OptimQTorch(FusedActivation):
     """OptimQ: f(x) = α·arctan(β·x) + γ·x·sigmoid(δ·x) + ε·softplus(ζ·x)·tanh(η·x)"""
     def __init__(self):
         super(OptimQTorch, self).__init__()
@@ -772,61 +1085,63 @@ class OptimQTorch(nn.Module):
 
 # --- Static Activation Functions (PyTorch Modules for consistency) ---
 
-class SinhGateTorch(nn.Module):
+class SinhGateTorch(FusedActivation):
     """f(x) = x * sinh(x)"""
     def __init__(self): super(SinhGateTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor: return x * torch.sinh(x)
 
-class SoftRBFTorch(nn.Module):
+class SoftRBFTorch(FusedActivation):
     """f(x) = x * exp(-x^2)"""
     def __init__(self): super(SoftRBFTorch, self).__init__()
-    def forward(self, x: torch.Tensor) -> torch.Tensor: return x * torch.exp(-torch.square(x))
+    def forward(self, x: torch.Tensor) -> torch.Tensor: return x * _gauss(x)
 
-class ATanSigmoidTorch(nn.Module):
+class ATanSigmoidTorch(FusedActivation):
     """f(x) = arctan(x) * sigmoid(x)"""
     def __init__(self): super(ATanSigmoidTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor: return torch.atan(x) * torch.sigmoid(x)
 
-class ExpoSoftTorch(nn.Module):
+class ExpoSoftTorch(FusedActivation):
     """f(x) = softsign(x) * exp(-|x|)"""
     def __init__(self): super(ExpoSoftTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor: return F.softsign(x) * torch.exp(-torch.abs(x))
 
-class HarmonicTanhTorch(nn.Module):
+class HarmonicTanhTorch(FusedActivation):
     """f(x) = tanh(x) + sin(x)"""
     def __init__(self): super(HarmonicTanhTorch, self).__init__()
-    def forward(self, x: torch.Tensor) -> torch.Tensor: return torch.tanh(x) + torch.sin(x)
+    def forward(self, x: torch.Tensor) -> torch.Tensor: return _tanh(x) + torch.sin(x)
 
-class RationalSoftplusTorch(nn.Module):
+class RationalSoftplusTorch(FusedActivation):
     """f(x) = (x * sigmoid(x)) / (0.5 + x * sigmoid(x))"""
     def __init__(self): super(RationalSoftplusTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         swish_x = x * torch.sigmoid(x)
         return swish_x / (0.5 + swish_x + 1e-7) # Added epsilon for numerical stability
 
-class UnifiedSineExpTorch(nn.Module):
+class UnifiedSineExpTorch(FusedActivation):
     """f(x) = x * sin(exp(-x^2))"""
     def __init__(self): super(UnifiedSineExpTorch, self).__init__()
-    def forward(self, x: torch.Tensor) -> torch.Tensor: return x * torch.sin(torch.exp(-torch.square(x)))
+    def forward(self, x: torch.Tensor) -> torch.Tensor: return x * torch.sin(_gauss(x))
 
-class SigmoidErfTorch(nn.Module):
+class SigmoidErfTorch(FusedActivation):
     """f(x) = sigmoid(x) * erf(x)"""
     def __init__(self): super(SigmoidErfTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor: return torch.sigmoid(x) * torch.erf(x)
 
-class LogCoshGateTorch(nn.Module):
+class LogCoshGateTorch(FusedActivation):
     """f(x) = x * log(cosh(x))"""
     def __init__(self): super(LogCoshGateTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        # Add epsilon for numerical stability
-        return x * torch.log(torch.cosh(x) + 1e-7)
+        # log(cosh(x)) == |x| + softplus(-2|x|) - log(2): bounded for all x
+        # (cosh alone overflows fp32 past |x| ~ 88) and one exp/log cheaper.
+        abs_x = torch.abs(x)
+        return x * (abs_x + F.softplus(-2.0 * abs_x) - _LOG_2)
 
-class TanhArcTorch(nn.Module):
+class TanhArcTorch(FusedActivation):
     """f(x) = tanh(x) * arctan(x)"""
     def __init__(self): super(TanhArcTorch, self).__init__()
-    def forward(self, x: torch.Tensor) -> torch.Tensor: return torch.tanh(x) * torch.atan(x)
+    def forward(self, x: torch.Tensor) -> torch.Tensor: return _tanh(x) * torch.atan(x)
 
-class RiemannianSoftsignActivationTorch(nn.Module):
+class RiemannianSoftsignActivationTorch(FusedActivation):
     """f(x) = (arctan(x) * erf(x)) / (1 + |x|)"""
     def __init__(self): super(RiemannianSoftsignActivationTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -834,39 +1149,47 @@ class RiemannianSoftsignActivationTorch(nn.Module):
         denominator = 1.0 + torch.abs(x)
         return numerator / (denominator + 1e-7)
 
-class QuantumTanhActivationTorch(nn.Module):
+class QuantumTanhActivationTorch(FusedActivation):
     """f(x) = tanh(x) * exp(-tan(x)^2)"""
     def __init__(self): super(QuantumTanhActivationTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        tan_x_squared = torch.square(torch.tan(x))
-        return torch.tanh(x) * torch.exp(-tan_x_squared)
+        # tan(x)^2 overflows to inf at x = pi/2 + k*pi and poisons gradients
+        # with NaN; sin^2/(cos^2 + eps) stays finite (the function is ~0
+        # there anyway), and sin/cos lower to a single sincos intrinsic.
+        sin_x = torch.sin(x)
+        cos_x = torch.cos(x)
+        tan_x_squared = (sin_x * sin_x) / (cos_x * cos_x + 1e-12)
+        return _tanh(x) * torch.exp(-tan_x_squared)
 
-class LogExponentialActivationTorch(nn.Module):
+class LogExponentialActivationTorch(FusedActivation):
     """f(x) = sign(x) * log(1 + exp(|x| - 1/|x|))"""
     def __init__(self): super(LogExponentialActivationTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         abs_x = torch.abs(x)
         abs_x_safe = abs_x + 1e-7
         exponent = abs_x - torch.pow(abs_x_safe, -1.0)
-        return torch.sign(x) * torch.log(1.0 + torch.exp(exponent) + 1e-7)
+        # x / abs_x_safe replaces sign(x) with the reciprocal already needed
+        # above, saving a kernel and keeping a subgradient at 0;
+        # log(1 + exp(e)) is softplus(e), stable without the old eps hack.
+        return (x / abs_x_safe) * F.softplus(exponent)
 
-class BipolarGaussianArctanActivationTorch(nn.Module):
+class BipolarGaussianArctanActivationTorch(FusedActivation):
     """f(x) = arctan(x) * exp(-x^2)"""
     def __init__(self): super(BipolarGaussianArctanActivationTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return torch.atan(x) * torch.exp(-torch.square(x))
+        return torch.atan(x) * _gauss(x)
 
-class ExpArcTanHarmonicActivationTorch(nn.Module):
+class ExpArcTanHarmonicActivationTorch(FusedActivation):
     """f(x) = exp(-x^2) * arctan(x) * sin(x)"""
     def __init__(self): super(ExpArcTanHarmonicActivationTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return torch.exp(-torch.square(x)) * torch.atan(x) * torch.sin(x)
+        return _gauss(x) * torch.atan(x) * torch.sin(x)
 
-class LogisticWActivationTorch(nn.Module):
+class LogisticWActivationTorch(FusedActivation):
     """f(x) = x / (1 + exp(-x * W(exp(x)))) where W is the Lambert W function."""
     def __init__(self): super(LogisticWActivationTorch, self).__init__()
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         exp_x = torch.exp(x)
-        lambertw_exp_x = torch_lambertw_principal(exp_x)
+        lambertw_exp_x = _LambertW.apply(exp_x)
         denominator_arg = -x * lambertw_exp_x
         return x / (1.0 + torch.exp(denominator_arg) + 1e-7)
\ No newline at end of file
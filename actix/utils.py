@@ -2,7 +2,47 @@
 
 import numpy as np
 
-__all__ = ['plot_activation', 'plot_derivative']
+__all__ = ['plot_activation', 'plot_derivative',
+           'numpy_lambertw_principal', 'numpy_ellipj_cn']
+
+# Numba is an optional accelerator: when installed, the NumPy companions
+# below compile to native loops (worthwhile on CPU for small tensors where
+# per-op dispatch overhead dominates); otherwise they run as plain NumPy.
+try:
+    from numba import njit as _njit
+    def _maybe_njit(func):
+        return _njit(fastmath=True, cache=True)(func)
+except ImportError:
+    def _maybe_njit(func):
+        return func
+
+@_maybe_njit
+def numpy_lambertw_principal(z):
+    """NumPy/Numba companion of ``torch_lambertw_principal``.
+
+    Same Halley iteration and branchless startup as the PyTorch solver, for
+    CPU pre/post-processing without a torch dependency.
+    """
+    l1 = np.log1p(np.maximum(z, 0.0))
+    w = l1 - np.log1p(l1)
+    for _ in range(4):
+        ew = np.exp(w)
+        f = w * ew - z
+        w_plus_1 = w + 1.0
+        denominator = ew * w_plus_1 - (w + 2.0) * f / (2.0 * w_plus_1) + 1e-20
+        w = np.maximum(w - f / denominator, 0.0)
+    return w
+
+@_maybe_njit
+def numpy_ellipj_cn(u, m):
+    """NumPy/Numba companion of ``torch_ellipj_cn`` (4-term series)."""
+    u_sq = np.square(u)
+    u_4 = u_sq * u_sq
+    u_6 = u_4 * u_sq
+    cn_val = (1.0 - u_sq / 2.0
+              + (u_4 / 24.0) * (1.0 + 4.0 * m)
+              - (u_6 / 720.0) * (1.0 + 44.0 * m + 16.0 * m * m))
+    return np.minimum(np.maximum(cn_val, -1.0), 1.0)
 
 def plot_activation(name: str, framework: str = 'tensorflow', x_range=(-5, 5), num_points=400):
     """
@@ -84,4 +84,65 @@ def test_get_activation_torch_custom():
 def test_get_activation_torch_standard():
     """Tests the get_activation function for a standard PyTorch activation."""
     act = get_activation('ReLU', framework='torch')
-    assert isinstance(act, nn.ReLU)
\ No newline at end of file
+    assert isinstance(act, nn.ReLU)
+
+@pytest.mark.skipif(not torch_available, reason="PyTorch not installed")
+def test_lambertw_solver_forward_accuracy():
+    """The 4-step Halley solver must satisfy the defining identity
+    w * exp(w) == z across the principal branch."""
+    from actix.activations_torch import torch_lambertw_principal
+
+    z = torch.tensor([0.0, 1e-3, 0.1, 0.5, 1.0, np.e, 10.0, 100.0],
+                     dtype=torch.float64)
+    w = torch_lambertw_principal(z)
+    assert torch.allclose(w * torch.exp(w), z, rtol=1e-6, atol=1e-6)
+
+@pytest.mark.skipif(not torch_available, reason="PyTorch not installed")
+def test_lambertw_analytic_backward():
+    """_LambertW's analytic backward must match autograd through the Halley
+    solver for z > 0, and give the true W'(0) = 1 at z = 0 (where autograd
+    through the solver loses the gradient to relu's zero subgradient)."""
+    from actix.activations_torch import _LambertW, _lambertw_halley
+
+    z = torch.tensor([1e-4, 0.2, 1.0, 5.0, 50.0],
+                     dtype=torch.float64, requires_grad=True)
+    _LambertW.apply(z).sum().backward()
+    z_ref = z.detach().clone().requires_grad_(True)
+    _lambertw_halley(z_ref).sum().backward()
+    assert torch.allclose(z.grad, z_ref.grad, rtol=1e-5, atol=1e-8)
+
+    z0 = torch.zeros(1, dtype=torch.float64, requires_grad=True)
+    _LambertW.apply(z0).sum().backward()
+    assert torch.allclose(z0.grad, torch.ones_like(z0), atol=1e-8)
+
+@pytest.mark.skipif(not torch_available, reason="PyTorch not installed")
+def test_elliptic_gaussian_fn_matches_autograd_reference():
+    """The analytic backward of _EllipticGaussianFn must match autograd
+    through the torch_ellipj_cn series, including inputs past the cn = +/-1
+    clamp boundary where the gradient is zero."""
+    from actix.activations_torch import _EllipticGaussianFn, torch_ellipj_cn
+
+    x = torch.linspace(-4.0, 4.0, 41, dtype=torch.float64, requires_grad=True)
+    m = torch.tensor([0.5], dtype=torch.float64, requires_grad=True)
+    out = _EllipticGaussianFn.apply(x, m)
+
+    x_ref = x.detach().clone().requires_grad_(True)
+    m_ref = m.detach().clone().requires_grad_(True)
+    ref = x_ref * torch.exp(-torch_ellipj_cn(x_ref, m_ref))
+
+    assert torch.allclose(out, ref, atol=1e-12)
+    out.sum().backward()
+    ref.sum().backward()
+    assert torch.allclose(x.grad, x_ref.grad, atol=1e-10)
+    assert torch.allclose(m.grad, m_ref.grad, atol=1e-10)
+
+@pytest.mark.skipif(not torch_available, reason="PyTorch not installed")
+def test_elliptic_gaussian_fn_gradcheck():
+    """Numerical gradcheck of the fused elliptic-Gaussian Function, with
+    points inside and well past the clamped region (none on its boundary)."""
+    from actix.activations_torch import _EllipticGaussianFn
+
+    x = torch.tensor([-3.0, -1.2, -0.3, 0.4, 1.1, 2.8],
+                     dtype=torch.float64, requires_grad=True)
+    m = torch.tensor([0.37], dtype=torch.float64, requires_grad=True)
+    assert torch.autograd.gradcheck(_EllipticGaussianFn.apply, (x, m))
\ No newline at end of file